@@ -2,6 +2,8 @@
 Utilities common to request method tests.
 """
 import datetime
+import functools
+
 import mws
 from mws.utils import clean_bool, clean_date, clean_string
 
@@ -12,6 +14,52 @@ import pytest
 # Need these utilities to be in ``tests.api``, to be shared with different API classes.
 
 
+# Fake credentials, exposed at module level so pytest fixtures and helpers
+# can use them without routing attribute lookups through the mixin class.
+CREDENTIAL_ACCESS = "cred_access"
+CREDENTIAL_SECRET = "cred_secret"
+CREDENTIAL_ACCOUNT = "cred_account"
+CREDENTIAL_TOKEN = "cred_token"
+
+
+@functools.lru_cache(maxsize=None)
+def _common_params_expected(account_type):
+    """Reference dict of the fixed common params expected in every request,
+    built once per account-type key and reused by `assert_common_params`.
+    """
+    return {
+        "AWSAccessKeyId": CREDENTIAL_ACCESS,
+        account_type: CREDENTIAL_ACCOUNT,
+        "MWSAuthToken": CREDENTIAL_TOKEN,
+        # Signature keys (below) are defined with string literals in MWS.get_params
+        # If test fails here, check that method.
+        "SignatureMethod": "HmacSHA256",
+        "SignatureVersion": "2",
+    }
+
+
+def assert_common_params(params, action=None, account_type=mws.mws.MWS.ACCOUNT_TYPE):
+    """Check the common params expected in every request call.
+
+    Usable directly by pytest-style test functions, without requiring
+    the `CommonAPIRequestTools` mixin.
+    """
+    if action:
+        assert params["Action"] == clean_string(action)
+
+    # Dict-view superset comparison checks all fixed common params at once.
+    assert params.items() >= _common_params_expected(account_type).items()
+
+    isoformat_str = "%Y-%m-%dT%H%%3A%M%%3A%S"
+    try:
+        datetime.datetime.strptime(params["Timestamp"], isoformat_str)
+    except ValueError:
+        pytest.fail(
+            "Timestamp expected an ISO-8601 datetime string url encoded"
+            " with format [YYYY-MM-DDTHH%3AMM%3ASS]."
+        )
+
+
 class CommonAPIRequestTools(object):
     """A set of common tools to use with MWS API request method tests.
 
@@ -26,10 +74,10 @@ class CommonAPIRequestTools(object):
     (see `setUp` method for details).
     """
 
-    CREDENTIAL_ACCESS = "cred_access"
-    CREDENTIAL_SECRET = "cred_secret"
-    CREDENTIAL_ACCOUNT = "cred_account"
-    CREDENTIAL_TOKEN = "cred_token"
+    CREDENTIAL_ACCESS = CREDENTIAL_ACCESS
+    CREDENTIAL_SECRET = CREDENTIAL_SECRET
+    CREDENTIAL_ACCOUNT = CREDENTIAL_ACCOUNT
+    CREDENTIAL_TOKEN = CREDENTIAL_TOKEN
 
     api_class = mws.mws.MWS
     """Define within a subclassing API TestCase with the class to be tested."""
@@ -48,25 +96,7 @@ class CommonAPIRequestTools(object):
 
     def assert_common_params(self, params, action=None):
         """Tests the common params expected in every call."""
-        if action:
-            assert params["Action"] == clean_string(action)
-
-        assert params["AWSAccessKeyId"] == self.CREDENTIAL_ACCESS
-        assert params[self.api.ACCOUNT_TYPE] == self.CREDENTIAL_ACCOUNT
-        assert params["MWSAuthToken"] == self.CREDENTIAL_TOKEN
-
-        # Signature keys (below) are defined with string literals in MWS.get_params
-        # If test fails here, check that method.
-        assert params["SignatureMethod"] == "HmacSHA256"
-        assert params["SignatureVersion"] == "2"
-        isoformat_str = "%Y-%m-%dT%H%%3A%M%%3A%S"
-        try:
-            datetime.datetime.strptime(params["Timestamp"], isoformat_str)
-        except ValueError:
-            pytest.fail(
-                "Timestamp expected an ISO-8601 datetime string url encoded"
-                " with format [YYYY-MM-DDTHH%3AMM%3ASS]."
-            )
+        assert_common_params(params, action=action, account_type=self.api.ACCOUNT_TYPE)
 
     def test_service_status(self):
         """Test the `GetServiceStatus` common request."""